@@ -20,11 +20,21 @@ Use -r or --recursive to process nested folders.
 # - adds content from svg, header, footer etc files
 # - added kludge to replace href in subdirs
 
+# Indexer v.1.0.3-slv (2026-10-15)
+# CHANGES:
+# - speed up large dirs: single scandir pass, one stat per entry, buffered binary writes
+# - process nested dirs with a thread pool when recursive
+# - ignore entries by exact name or suffix (IGNORE_EXACT, IGNORE_SUFFIX)
+# - --filter matches names with fnmatch, added --check-writable option
+
 import argparse
-import datetime
+import fnmatch
 import os
+import re
 import sys
-from pathlib import Path
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
 from urllib.parse import quote
 
 SCRIPTDIR = os.path.dirname(os.path.realpath(__file__))
@@ -34,18 +44,20 @@ WORKDIR = os.getcwd()
 
 DEFAULT_OUTPUT_FILE = 'index.html'
 
-INDEX_IGNORE = [
-    '.git', '.js', '.log', '.swp', 'rescan', 'rescan.txt',
-    'LINKS', 'CNAME', 'README', 'favicon.ico', 'assets', 'index.html', 'robots.txt',
+# entries to leave out of index: exact names and name endings
+IGNORE_EXACT = frozenset({
+    'rescan', 'rescan.txt',
+    'LINKS', 'CNAME', 'README', 'README.md', 'favicon.ico', 'assets', 'index.html', 'robots.txt',
     'Gemfile', 'Gemfile.lock', '404.html', 'about.markdown', 'index.markdown', 'index.md', 'scripts', 'vendor',
-]
+})
+IGNORE_SUFFIX = ('.git', '.js', '.log', '.swp')
 
-INCLUDE_FILES = [
-         { 'htaccess': f'{WORKDIR}/.htaccess' },
-         { 'svg': f'{SCRIPTDIR}/indexer.svg' },
-         { 'header': f'{WORKDIR}/_includes/header.html' },
-         { 'footer': f'{WORKDIR}/_includes/footer1.html' },
-]
+INCLUDE_FILES = {
+    'htaccess': f'{WORKDIR}/.htaccess',
+    'svg': f'{SCRIPTDIR}/indexer.svg',
+    'header': f'{WORKDIR}/_includes/header.html',
+    'footer': f'{WORKDIR}/_includes/footer1.html',
+}
 
 # add one or more entries to index
 CUSTOM_INDEX = [
@@ -63,70 +75,55 @@ SUBDIR_REPLACE = [
         ['favicon.ico', '../favicon.ico']
 ]
 
+# max bytes of html kept in memory before writing them to index file
+WRITE_BUFFER_SIZE = 1024 * 1024
 
-HTACCESS_MAPPING = CONTENT = FILES_OBJ = {}
-if 'CUSTOM_INDEX' not in globals():
-    CUSTOM_INDEX = []
-CONTENT['custom_index'] = CUSTOM_INDEX
-for f in INCLUDE_FILES:
-    for name, path in f.items():
-        if os.path.isfile(path):
-            with open(path, 'r', encoding='utf-8', errors='ignore') as FILES_OBJ[path]:
-                if name == 'htaccess':
-                    CONTENT['htaccess'] = FILES_OBJ[path].readlines()
-                    for line in CONTENT['htaccess']:
-                        if line.startswith('AddDescription'):
-                            HTACCESS_MAPPING[line.split()[-1]] = ' '.join(line.split()[1:-1])
-                else:
-                    CONTENT[name] = FILES_OBJ[path].read()
-        else:
-            CONTENT[name] = ''
-            print("Not found:", path)
+# number of threads used to process nested dirs with -r
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
+# AddDescription "some text" file
+HTACCESS_DESC_RE = re.compile(r'^AddDescription\s+"?(.*?)"?\s+(\S+)\s*$')
 
-def process_dir(top_dir, opts, content):
-    """ creates index file for path """
-    glob_patt = opts.filter or '*'
+# append trailing slash to dirs, unless it's windows
+DIR_TRAILING_SLASH = os.name != 'nt'
 
-    path_top_dir: Path
-    path_top_dir = Path(top_dir)
-    index_file = None
-
-    index_path = Path(path_top_dir, opts.output_file)
-
-    if opts.verbose:
-        print(f'Traversing dir {path_top_dir.absolute()}')
+# chars that urllib.parse.quote() would percent-encode
+URL_UNSAFE_RE = re.compile(r'[^A-Za-z0-9\-_.~/]')
 
+HTACCESS_MAPPING, CONTENT = {}, {}
+if 'CUSTOM_INDEX' not in globals():
+    CUSTOM_INDEX = []
+CONTENT['custom_index'] = CUSTOM_INDEX
+for name, path in INCLUDE_FILES.items():
+    # kept as bytes and written to index files as is, only htaccess gets decoded for parsing
     try:
-        index_file = open(index_path, 'w', encoding='utf-8')
-    except Exception as e:
-        print('cannot create file %s %s' % (index_path, e))
-        return
-
-    go_up = False
-    if TOPDIR_UP:
-        go_up = True
-    if any(i in f'{path_top_dir.absolute()}' for i in SUBDIRS):
-        for old, new in SUBDIR_REPLACE:
-            if opts.verbose:
-                print(f"Subdir: replacing '{old}' -> '{new}'")
-            content['header'] = content.get('header').replace(old, new)
-        for i in content['custom_index']:
-            href = i.get('href')
-            if href:
-                i.update(href = f'../{href}')
-        go_up = True
-
-    if content['header']:
-        if opts.verbose:
-            print("Adding header")
-        index_file.write(content['header'])
-
-    if content['svg']:
-        if opts.verbose:
-            print("Adding svg")
-        index_file.write(content['svg'])
-    index_file.write("""
+        with open(path, 'rb') as fh:
+            data = fh.read()
+    except FileNotFoundError:
+        data = b''
+        print("Not found:", path)
+    except OSError as e:
+        data = b''
+        print('cannot read file %s %s' % (path, e))
+    if name == 'htaccess':
+        CONTENT['htaccess'] = data.decode('utf-8', errors='ignore').splitlines()
+        HTACCESS_MAPPING.update(
+            (m.group(2), ' '.join(m.group(1).split())) for line in CONTENT['htaccess'] if (m := HTACCESS_DESC_RE.match(line))
+        )
+    else:
+        CONTENT[name] = data
+
+# per parent dir name: mapping with 'dir/file' descriptions merged in as 'file'
+HTACCESS_DIR_MAPPING = {}
+for key, desc in HTACCESS_MAPPING.items():
+    if key.count('/') == 1:
+        parent, basename = key.split('/')
+        if parent not in HTACCESS_DIR_MAPPING:
+            HTACCESS_DIR_MAPPING[parent] = dict(HTACCESS_MAPPING)
+        HTACCESS_DIR_MAPPING[parent][basename] = desc
+
+# html templates, parsed once and filled in with str.format_map()
+HEADER_TEMPLATE = """
         <header></header>
         <main>
         <div class="listing">
@@ -144,10 +141,12 @@ def process_dir(top_dir, opts, content):
                     </tr>
                 </thead>
                 <tbody>
-                    <tr class="clickable">
+"""
+
+GOUP_TEMPLATE = """                    <tr class="clickable">
                         <td></td>
                         <td>
-                            <a href=\""""f'{".." if go_up else "."}'"""\"><svg width="1.5em" height="1em" version="1.1" viewBox="0 0 24 24"><use href="#go-up" xlink:href="#go-up"></use></svg>
+                            <a href="{href}"><svg width="1.5em" height="1em" version="1.1" viewBox="0 0 24 24"><use href="#go-up" xlink:href="#go-up"></use></svg>
                             <span class="goup">..</span></a>
                         </td>
                         <td>&mdash;</td>
@@ -155,169 +154,290 @@ def process_dir(top_dir, opts, content):
                         <td class="hideable">&mdash;</td>
                         <td class="hideable"></td>
                     </tr>
-    """)
-    if content['custom_index']:
-        for i in content['custom_index']:
-            if opts.verbose:
-                print("Adding custom_index")
-            index_file.write("""
-                        <tr class="clickable" """f'{"style=display:none;" if len(i) == 0 else ""}'""">
+    """
+
+CUSTOM_ROW_TEMPLATE = """
+                        <tr class="clickable" {style}>
                             <td></td>
                             <td>
-                                <a href=\""""f'{i.get("href")}'"""\">
-                                <svg width="1.5em" height="1em" version="1.1" viewBox="0 0 265 323"><use href=\""""f'{i.get("icon")}'"""\" xlink:href=\""""f'{i.get("icon")}'"""\"></use></svg>
-                                <span class="goup">"""f'{i.get("name")}'"""</span></a>
+                                <a href="{href}">
+                                <svg width="1.5em" height="1em" version="1.1" viewBox="0 0 265 323"><use href="{icon}" xlink:href="{icon}"></use></svg>
+                                <span class="goup">{name}</span></a>
                             </td>
-                            <td>"""f'{i.get("description")}'"""</td>
+                            <td>{description}</td>
                             <td>&mdash;</td>
                             <td class="hideable">&mdash;</td>
                             <td class="hideable"></td>
                         </tr>
-            """)
-
-    # sort dirs first
-    sorted_entries = sorted(path_top_dir.glob(glob_patt), key=lambda p: (p.is_file(), p.name))
-
-    entry: Path
-    for entry in sorted_entries:
-
-        # don't include index.html in the file listing
-        if entry.name.lower() == opts.output_file.lower():
-            continue
+            """
 
-        # don't include entries starting with . or _ or listed in INDEX_IGNORE
-        if entry.name.startswith('.') or entry.name.startswith('_') or any(i in entry.name for i in INDEX_IGNORE):
-            if opts.verbose:
-                print(f"Ignoring '{entry.name}'")
-            continue
-
-        if entry.is_dir() and opts.recursive:
-            process_dir(entry, opts, content)
-
-        # From Python 3.6, os.access() accepts path-like objects
-        if (not entry.is_symlink()) and not os.access(str(entry), os.W_OK):
-            print(f"*** WARNING *** entry {entry.absolute()} is not writable! SKIPPING!")
-            continue
-        if opts.verbose:
-            print(f'{entry.absolute()}')
-
-        size_bytes = -1  ## is a folder
-        size_pretty = '&mdash;'
-        last_modified = '-'
-        last_modified_human_readable = '-'
-        last_modified_iso = ''
-        description = ''
-        try:
-            if entry.is_file():
-                size_bytes = entry.stat().st_size
-                size_pretty = pretty_size(size_bytes)
-
-            if entry.is_dir() or entry.is_file():
-                last_modified = datetime.datetime.fromtimestamp(entry.stat().st_mtime).replace(microsecond=0)
-                last_modified_iso = last_modified.isoformat()
-                #last_modified_human_readable = last_modified.strftime("%c")
-                last_modified_human_readable = last_modified.strftime("%F %T")
-
-        except Exception as e:
-            print('ERROR accessing file name:', e, entry)
-            continue
-
-        entry_path = str(entry.name)
-
-        if entry.is_dir() and not entry.is_symlink():
-            entry_type = 'folder'
-            if os.name not in ('nt',):
-                # append trailing slash to dirs, unless it's windows
-                entry_path = os.path.join(entry.name, '')
-        elif entry.is_dir() and entry.is_symlink():
-            entry_type = 'folder-shortcut'
-            print('dir-symlink', entry.absolute())
-        elif entry.is_file() and entry.is_symlink():
-            entry_type = 'file-shortcut'
-            print('file-symlink', entry.absolute())
-        elif entry.is_file() and entry.name.endswith('.sh'):
-            entry_type = 'file-sh'
-        elif entry.is_file() and entry.name.endswith('.tcl'):
-            entry_type = 'file-tcl'
-        elif entry.is_file() and entry.name.endswith('.c'):
-            entry_type = 'file-c'
-        elif entry.is_file() and entry.name.endswith('.tar'):
-            entry_type = 'file-archive'
-        elif entry.is_file() and (entry.name.endswith('.tar.gz') or entry.name.endswith('.tgz') or entry.name.endswith('.tar.bz2') or entry.name.endswith('.tar.xz')):
-            entry_type = 'file-archive'
-        elif entry.is_file() and entry.name.endswith('.rar'):
-            entry_type = 'file-archive'
-        elif entry.is_file() and entry.name.endswith('.zip'):
-            entry_type = 'file-archive'
-        else:
-            entry_type = 'file'
-
-        description = "&mdash;"
-
-        if HTACCESS_MAPPING.get('/'.join(entry.parts[-2:])):
-            description = HTACCESS_MAPPING.get('/'.join(entry.parts[-2:]))
-        elif HTACCESS_MAPPING.get(entry.name):
-            description = HTACCESS_MAPPING.get(entry.name)
-        description = description.lstrip('"').strip('"')
-
-        index_file.write(f"""
+ROW_TEMPLATE = """
             <tr class="file">
                 <td></td>
                 <td>
-                    <a href="{quote(entry_path)}">
-                        <svg width="1.5em" height="1em" version="1.1" viewBox="0 0 265 323"><use href="#{entry_type}" xlink:href="#{entry_type}"></use></svg>
-                        <span class="name">{entry.name}</span>
+                    <a href="{href}">
+                        <svg width="1.5em" height="1em" version="1.1" viewBox="0 0 265 323"><use href="#{type}" xlink:href="#{type}"></use></svg>
+                        <span class="name">{name}</span>
                     </a>
                 </td>
                 <td>{description}</td>
                 <td data-order="{size_bytes}">{size_pretty}</td>
-                <td class="hideable"><time datetime="{last_modified_iso}">{last_modified_human_readable}</time></td>
+                <td class="hideable"><time datetime="{iso}">{human}</time></td>
                 <td class="hideable"></td>
             </tr>
-        """)
+        """
 
-    index_file.write("""
+FOOTER_TEMPLATE = """
                 </tbody>
             </table>
         </div>
         <footer/>
         </main>
-    """)
-    if content['footer']:
-        if opts.verbose:
-            print("Adding footer")
-        index_file.write(content['footer'])
-    if index_file:
-        index_file.close()
-
-
-# bytes pretty-printing
-UNITS_MAPPING = [
-    (1024 ** 5, ' PB'),
-    (1024 ** 4, ' TB'),
-    (1024 ** 3, ' GB'),
-    (1024 ** 2, ' MB'),
-    (1024 ** 1, ' KB'),
-    (1024 ** 0, (' byte', ' bytes')),
-]
+    """
 
+# static parts, encoded once
+HEADER_BYTES = HEADER_TEMPLATE.encode()
+FOOTER_BYTES = FOOTER_TEMPLATE.encode()
 
-def pretty_size(f_bytes, units=UNITS_MAPPING):
+
+def entry_is(check):
+    """ returns result of a DirEntry type check like entry.is_dir, False on OSError (as pathlib does) """
+    try:
+        return check()
+    except OSError:
+        return False
+
+
+def write_all(fd, data):
+    """ writes all of data to fd, os.write() may write less than asked """
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+    view.release()
+
+
+def subdir_content(content):
+    """ returns copy of content for SUBDIRS, with SUBDIR_REPLACE applied and '../' prepended to custom hrefs """
+    header = content.get('header')
+    for old, new in SUBDIR_REPLACE:
+        header = header.replace(old.encode(), new.encode())
+    custom_index = [dict(i, href=f'../{i["href"]}') if i.get('href') else i for i in content['custom_index']]
+    return dict(content, header=header, custom_index=custom_index)
+
+
+def process_dir(top_dir, opts, content):
+    """ creates index file for path, returns list of subdirs to process when recursive """
+    # resolved once, used for output, SUBDIRS matching, scandir and htaccess lookups
+    abs_top_dir = os.path.abspath(top_dir)
+
+    index_path = os.path.join(abs_top_dir, opts.output_file)
+
+    if opts.verbose:
+        print(f'Traversing dir {abs_top_dir}')
+
+    # single scandir pass, DirEntry caches file type so sorting needs no extra stat calls
+    try:
+        with os.scandir(abs_top_dir) as it:
+            entries = list(it)
+    except OSError as e:
+        print('cannot read dir %s %s' % (abs_top_dir, e))
+        entries = []
+    if opts.filter:
+        keep = set(fnmatch.filter([e.name for e in entries], opts.filter))
+        entries = [e for e in entries if e.name in keep]
+
+    # sort dirs (and other non-files) first, is_file is looked up once per entry and reused below
+    sorted_entries = sorted((entry_is(e.is_file), e.name, e) for e in entries)
+    descriptions = HTACCESS_DIR_MAPPING.get(os.path.basename(abs_top_dir), HTACCESS_MAPPING)
+
+    try:
+        index_fd = os.open(index_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+    except Exception as e:
+        print('cannot create file %s %s' % (index_path, e))
+        return []
+    try:
+        # collect html in buf and write it out in one go (or every WRITE_BUFFER_SIZE bytes)
+        buf = bytearray()
+        subdirs = []
+
+        go_up = False
+        if TOPDIR_UP:
+            go_up = True
+        if any(i in abs_top_dir for i in SUBDIRS):
+            if opts.verbose:
+                for old, new in SUBDIR_REPLACE:
+                    print(f"Subdir: replacing '{old}' -> '{new}'")
+            content = content.get('subdir') or subdir_content(content)
+            go_up = True
+
+        if content['header']:
+            if opts.verbose:
+                print("Adding header")
+            buf += content['header']
+
+        if content['svg']:
+            if opts.verbose:
+                print("Adding svg")
+            buf += content['svg']
+        buf += HEADER_BYTES
+        buf += GOUP_TEMPLATE.format_map({'href': '..' if go_up else '.'}).encode()
+        if content['custom_index']:
+            for i in content['custom_index']:
+                if opts.verbose:
+                    print("Adding custom_index")
+                buf += CUSTOM_ROW_TEMPLATE.format_map({
+                    'style': 'style=display:none;' if len(i) == 0 else '',
+                    'href': i.get('href'),
+                    'icon': i.get('icon'),
+                    'name': i.get('name'),
+                    'description': i.get('description'),
+                }).encode()
+
+        # loop invariants as locals, saves attribute and global lookups per entry
+        verbose = opts.verbose
+        recursive = opts.recursive
+        check_writable = opts.check_writable
+        out_lower = opts.output_file.lower()
+        ignore_exact = IGNORE_EXACT
+        ignore_suffix = IGNORE_SUFFIX
+        trailing_slash = DIR_TRAILING_SLASH
+
+        entry: os.DirEntry
+        for is_file, name, entry in sorted_entries:
+
+            # don't include index.html in the file listing
+            if name.lower() == out_lower:
+                continue
+
+            # don't include entries starting with . or _ or listed in IGNORE_EXACT/IGNORE_SUFFIX
+            if name in ignore_exact or name.endswith(ignore_suffix) or name[:1] in ('.', '_'):
+                if verbose:
+                    print(f"Ignoring '{name}'")
+                continue
+
+            is_dir = entry_is(entry.is_dir)
+            is_symlink = entry_is(entry.is_symlink)
+
+            if is_dir and recursive:
+                subdirs.append(entry.path)
+
+            # skip non-writable entries only if asked to, saves an access() call per entry
+            if check_writable and (not is_symlink) and not os.access(entry.path, os.W_OK):
+                print(f"*** WARNING *** entry {entry.path} is not writable! SKIPPING!")
+                continue
+            if verbose:
+                print(f'{entry.path}')
+
+            size_bytes = -1  ## is a folder
+            size_pretty = '&mdash;'
+            last_modified_human_readable = '-'
+            last_modified_iso = ''
+            description = ''
+            try:
+                if is_dir or is_file:
+                    # one stat per entry, for symlinks it's already cached by is_dir()/is_file()
+                    st = entry.stat()
+                    if is_file:
+                        size_bytes = st.st_size
+                        size_pretty = pretty_size(size_bytes)
+                    # format local time once, iso only differs by the 'T' separator
+                    last_modified_human_readable = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(st.st_mtime))
+                    last_modified_iso = last_modified_human_readable.replace(' ', 'T')
+
+            except OSError as e:
+                print('ERROR accessing file name:', e, entry.path)
+                continue
+
+            entry_path = name
+
+            if is_dir and not is_symlink:
+                entry_type = 'folder'
+                if trailing_slash:
+                    entry_path = name + '/'
+            elif is_dir and is_symlink:
+                entry_type = 'folder-shortcut'
+                print('dir-symlink', entry.path)
+            elif is_file and is_symlink:
+                entry_type = 'file-shortcut'
+                print('file-symlink', entry.path)
+            elif is_file and name.endswith('.sh'):
+                entry_type = 'file-sh'
+            elif is_file and name.endswith('.tcl'):
+                entry_type = 'file-tcl'
+            elif is_file and name.endswith('.c'):
+                entry_type = 'file-c'
+            elif is_file and name.endswith('.tar'):
+                entry_type = 'file-archive'
+            elif is_file and (name.endswith('.tar.gz') or name.endswith('.tgz') or name.endswith('.tar.bz2') or name.endswith('.tar.xz')):
+                entry_type = 'file-archive'
+            elif is_file and name.endswith('.rar'):
+                entry_type = 'file-archive'
+            elif is_file and name.endswith('.zip'):
+                entry_type = 'file-archive'
+            else:
+                entry_type = 'file'
+
+            description = descriptions.get(name, "&mdash;")
+
+            buf += ROW_TEMPLATE.format_map({
+                'href': quote(entry_path) if URL_UNSAFE_RE.search(entry_path) else entry_path,
+                'type': entry_type,
+                'name': name,
+                'description': description,
+                'size_bytes': size_bytes,
+                'size_pretty': size_pretty,
+                'iso': last_modified_iso,
+                'human': last_modified_human_readable,
+            }).encode()
+            if len(buf) >= WRITE_BUFFER_SIZE:
+                write_all(index_fd, buf)
+                buf.clear()
+
+        buf += FOOTER_BYTES
+        if content['footer']:
+            if opts.verbose:
+                print("Adding footer")
+            buf += content['footer']
+        write_all(index_fd, buf)
+    finally:
+        os.close(index_fd)
+    return subdirs
+
+
+def process_tree(top_dir, opts, content):
+    """ creates index files for top_dir and, if recursive, its subdirs using a thread pool """
+    # shared between threads, so SUBDIRS content is prepared once up-front and never mutated
+    content = dict(content, subdir=subdir_content(content))
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        # future -> dir, so errors can be reported per dir without stopping the others
+        pending = {pool.submit(process_dir, top_dir, opts, content): top_dir}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                path = pending.pop(future)
+                try:
+                    subdirs = future.result()
+                except Exception as e:
+                    print('ERROR processing dir:', e, path)
+                    continue
+                for subdir in subdirs:
+                    pending[pool.submit(process_dir, subdir, opts, content)] = subdir
+
+
+# bytes pretty-printing, one suffix per power of 1024
+UNIT_SUFFIX = (' bytes', ' KB', ' MB', ' GB', ' TB', ' PB')
+
+
+@lru_cache(maxsize=4096)
+def pretty_size(f_bytes):
     """Human-readable file sizes.
     ripped from https://pypi.python.org/pypi/hurry.filesize/
+    unit is picked from bit_length() instead of looping over units
     """
-    for factor, suffix in units:
-        if f_bytes >= factor:
-            break
-    amount = int(f_bytes / factor)
-
-    if isinstance(suffix, tuple):
-        singular, multiple = suffix
-        if amount == 1:
-            suffix = singular
-        else:
-            suffix = multiple
-    return str(amount) + suffix
+    if f_bytes < 1024:
+        return '1 byte' if f_bytes == 1 else f'{f_bytes} bytes'
+    unit = min((f_bytes.bit_length() - 1) // 10, len(UNIT_SUFFIX) - 1)
+    return f'{f_bytes >> (10 * unit)}{UNIT_SUFFIX[unit]}'
 
 
 if __name__ == "__main__":
@@ -345,6 +465,11 @@ Email josh dot brunty at marshall dot edu for additional help. ''')
                         help="recursively process nested dirs (FALSE by default)",
                         required=False)
 
+    parser.add_argument('--check-writable', '-w',
+                        action='store_true',
+                        help="skip entries that are not writable, with a warning (FALSE by default)",
+                        required=False)
+
     parser.add_argument('--verbose', '-v',
                         action='store_true',
                         help='***WARNING: can take longer time with complex file tree structures on slow terminals***'
@@ -352,4 +477,4 @@ Email josh dot brunty at marshall dot edu for additional help. ''')
                         required=False)
 
     config = parser.parse_args(sys.argv[1:])
-    process_dir(config.top_dir, config, CONTENT)
+    process_tree(config.top_dir, config, CONTENT)